@@ -22,12 +22,18 @@ Usage in Rhino:
 Requirements:
 - Rhino 6 or later with Python support
 - rhinoscriptsyntax module
+- orjson (optional, Rhino 8 CPython only) for faster JSON writing
 """
 
 import rhinoscriptsyntax as rs
 import json
 import math
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def point_to_array(point, is_profile=False):
     """
     Convert a Rhino point to array format
@@ -57,12 +63,10 @@ def get_curve_endpoints(curve_id):
         Tuple of (start_point, end_point) or None if failed
     """
     try:
-        domain = rs.CurveDomain(curve_id)
-        if domain is None:
-            return None
-        
-        start_point = rs.EvaluateCurve(curve_id, domain[0])
-        end_point = rs.EvaluateCurve(curve_id, domain[1])
+        # Read the endpoints directly instead of fetching the domain and
+        # evaluating at both ends (2 Rhino calls instead of 3)
+        start_point = rs.CurveStartPoint(curve_id)
+        end_point = rs.CurveEndPoint(curve_id)
         
         if start_point and end_point:
             return (start_point, end_point)
@@ -72,6 +76,98 @@ def get_curve_endpoints(curve_id):
     return None
 
 
+def classify_curve(curve_id):
+    """
+    Classify a curve object with as few Rhino probes as possible
+    
+    Args:
+        curve_id: Rhino object ID of the curve
+    
+    Returns:
+        One of 'line', 'arc', 'circle', 'polyline', 'curve'
+    """
+    # Probes stop at the first match, most common type first. IsLine must
+    # run before IsPolyline since a two-point polyline is also a line.
+    if rs.IsLine(curve_id):
+        return 'line'
+    if rs.IsArc(curve_id):
+        return 'arc'
+    if rs.IsCircle(curve_id):
+        return 'circle'
+    if rs.IsPolyline(curve_id):
+        return 'polyline'
+    return 'curve'
+
+
+def circular_properties(curve_id, is_profile, plane_fn, radius_fn):
+    """
+    Get center, radius and direction of an arc or circle
+    
+    Args:
+        curve_id: Rhino object ID of the arc or circle
+        is_profile: If True, uses 2D points. If False, uses 3D points
+        plane_fn: rs.ArcPlane or rs.CirclePlane
+        radius_fn: rs.ArcRadius or rs.CircleRadius
+    
+    Returns:
+        Dictionary with 'center', 'radius' and 'clockwise', or empty if failed
+    """
+    try:
+        # The plane is centered on the curve, so its origin is the center
+        # point - no separate ArcCenterPoint/CircleCenterPoint call needed
+        plane = plane_fn(curve_id)
+        radius = radius_fn(curve_id)
+        
+        if plane and radius:
+            # Normal pointing up (Z > 0) means counterclockwise, the same
+            # for 2D profiles and 3D paths
+            normal = plane[3]  # Normal vector is the 4th element of plane
+            return {
+                'center': point_to_array(plane[0], is_profile),
+                'radius': float(radius),
+                'clockwise': bool(normal[2] < 0.0),
+            }
+    except:
+        # If properties fail, continue without them
+        # Fallback will handle it
+        pass
+    
+    return {}
+
+
+def add_arc_properties(arc_id, segment, is_profile=False):
+    """
+    Add center, radius and direction of an arc to its segment
+    
+    Args:
+        arc_id: Rhino object ID of the arc
+        segment: Segment dictionary to update
+        is_profile: If True, uses 2D points. If False, uses 3D points
+    """
+    segment.update(circular_properties(arc_id, is_profile, rs.ArcPlane, rs.ArcRadius))
+
+
+def add_circle_properties(circle_id, segment, is_profile=False):
+    """
+    Add center, radius, direction and closed flag of a circle to its segment
+    
+    Args:
+        circle_id: Rhino object ID of the circle
+        segment: Segment dictionary to update
+        is_profile: If True, uses 2D points. If False, uses 3D points
+    """
+    segment['closed'] = True
+    segment.update(circular_properties(circle_id, is_profile, rs.CirclePlane, rs.CircleRadius))
+
+
+# Type-specific segment properties, keyed by classify_curve result.
+# Lines, polylines and generic curves only need their endpoints.
+SEGMENT_PROPERTY_HANDLERS = {
+    'arc': add_arc_properties,
+    'circle': add_circle_properties,
+}
+
+
 def geometry_to_segment(obj_id, is_profile=False):
     """
     Convert a Rhino geometry object to a segment with type and endpoints
@@ -88,84 +184,23 @@ def geometry_to_segment(obj_id, is_profile=False):
     if obj_type != rs.filter.curve:
         return None
     
-    segment = {}
-    
-    # Determine geometry type
-    if rs.IsLine(obj_id):
-        segment['type'] = 'line'
-    elif rs.IsArc(obj_id):
-        segment['type'] = 'arc'
-        # Extract arc properties for accurate arc sampling
-        try:
-            arc_center = rs.ArcCenterPoint(obj_id)
-            arc_radius = rs.ArcRadius(obj_id)
-            
-            if arc_center and arc_radius:
-                segment['center'] = point_to_array(arc_center, is_profile)
-                segment['radius'] = float(arc_radius)
-                
-                # Determine arc direction (clockwise or counterclockwise)
-                # Get arc plane to determine direction
-                arc_plane = rs.ArcPlane(obj_id)
-                if arc_plane:
-                    # Check if arc normal points up (counterclockwise) or down (clockwise)
-                    # For 2D profiles, check Z component of normal
-                    normal = arc_plane[3]  # Normal vector is the 4th element of plane
-                    if is_profile:
-                        # For profiles in XY plane, Z > 0 means counterclockwise
-                        segment['clockwise'] = (normal[2] < 0)
-                    else:
-                        # For 3D paths, use the same logic
-                        segment['clockwise'] = (normal[2] < 0)
-        except:
-            # If arc properties fail, continue without them
-            # Fallback will handle it
-            pass
-    elif rs.IsCircle(obj_id):
-        segment['type'] = 'circle'
-        segment['closed'] = True
-        # Extract circle properties
-        try:
-            circle_center = rs.CircleCenterPoint(obj_id)
-            circle_radius = rs.CircleRadius(obj_id)
-            
-            if circle_center and circle_radius:
-                segment['center'] = point_to_array(circle_center, is_profile)
-                segment['radius'] = float(circle_radius)
-                
-                # Determine circle direction
-                circle_plane = rs.CirclePlane(obj_id)
-                if circle_plane:
-                    normal = circle_plane[3]
-                    if is_profile:
-                        segment['clockwise'] = (normal[2] < 0)
-                    else:
-                        segment['clockwise'] = (normal[2] < 0)
-        except:
-            # If circle properties fail, continue without them
-            pass
-    elif rs.IsPolyline(obj_id):
-        segment['type'] = 'polyline'
-        # For polylines, get first and last vertices
-        vertices = rs.PolylineVertices(obj_id)
-        if vertices and len(vertices) >= 2:
-            segment['start'] = point_to_array(vertices[0], is_profile)
-            segment['end'] = point_to_array(vertices[-1], is_profile)
-            if rs.IsCurveClosed(obj_id):
-                segment['closed'] = True
-            return segment
-    else:
-        # Generic curve
-        segment['type'] = 'curve'
+    segment = {'type': classify_curve(obj_id)}
     
-    # Get start and end points
+    add_properties = SEGMENT_PROPERTY_HANDLERS.get(segment['type'])
+    if add_properties:
+        add_properties(obj_id, segment, is_profile)
+    
+    # Get start and end points (polylines included - their endpoints are
+    # the curve endpoints, so there is no need to marshal every vertex)
     endpoints = get_curve_endpoints(obj_id)
     if endpoints:
         segment['start'] = point_to_array(endpoints[0], is_profile)
         segment['end'] = point_to_array(endpoints[1], is_profile)
         
-        # Check if closed
-        if rs.IsCurveClosed(obj_id):
+        # Check if closed - lines and arcs are always open and circles are
+        # flagged by their handler, so only polylines and generic curves
+        # need the probe
+        if segment['type'] in ('polyline', 'curve') and rs.IsCurveClosed(obj_id):
             segment['closed'] = True
         
         return segment
@@ -217,8 +252,13 @@ def export_to_json():
     
     # Write JSON file
     try:
-        with open(file_path, 'w') as f:
-            json.dump(segments, f, indent=2)
+        # Keep the indented layout either way - exported files get hand-edited
+        if orjson is not None:
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(segments, option=orjson.OPT_INDENT_2))
+        else:
+            with open(file_path, 'w') as f:
+                json.dump(segments, f, indent=2)
         
         rs.MessageBox("Successfully exported {} segments to:\n{}".format(len(segments), file_path), 
                      0, "Export Complete")
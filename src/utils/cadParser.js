@@ -296,6 +296,8 @@ export function segmentsToPoints(segments, expectedType, options = {}) {
   const points = []
   const isProfile = expectedType === 'profile'
   const maxSegmentLength = options.maxSegmentLength || 1.0
+  const tolerance = 0.001
+  const toleranceSq = tolerance * tolerance
   
   // Helper to get point in correct format (defined outside loop for reuse)
   const getPoint = (pt) => {
@@ -305,6 +307,14 @@ export function segmentsToPoints(segments, expectedType, options = {}) {
     return pt.length === 3 ? pt : [pt[0], pt[1], 0]
   }
   
+  // Helper to check if two points coincide (squared distance, no sqrt)
+  const isDuplicate = (p1, p2) => {
+    const dx = p1[0] - p2[0]
+    const dy = p1[1] - p2[1]
+    const dz = isProfile ? 0 : (p1[2] || 0) - (p2[2] || 0)
+    return dx * dx + dy * dy + dz * dz <= toleranceSq
+  }
+  
   // Reorder segments to form continuous path
   const orderedSegments = reorderSegments(segments, isProfile)
   
@@ -331,12 +341,8 @@ export function segmentsToPoints(segments, expectedType, options = {}) {
         // Check if first point of arc matches last point we added
         const prevSegment = orderedSegments[i - 1]
         const prevEnd = getPoint(prevSegment.end)
-        const tolerance = 0.001
-        const dist = isProfile
-          ? Math.sqrt((arcPoints[0][0] - prevEnd[0])**2 + (arcPoints[0][1] - prevEnd[1])**2)
-          : Math.sqrt((arcPoints[0][0] - prevEnd[0])**2 + (arcPoints[0][1] - prevEnd[1])**2 + ((arcPoints[0][2] || 0) - (prevEnd[2] || 0))**2)
         
-        if (dist > tolerance) {
+        if (!isDuplicate(arcPoints[0], prevEnd)) {
           // Not connected - add all points
           points.push(...arcPoints)
         } else {
@@ -352,12 +358,8 @@ export function segmentsToPoints(segments, expectedType, options = {}) {
         // Check if this segment connects to the previous one
         const prevSegment = orderedSegments[i - 1]
         const prevEnd = getPoint(prevSegment.end)
-        const tolerance = 0.001
-        const dist = isProfile
-          ? Math.sqrt((start[0] - prevEnd[0])**2 + (start[1] - prevEnd[1])**2)
-          : Math.sqrt((start[0] - prevEnd[0])**2 + (start[1] - prevEnd[1])**2 + ((start[2] || 0) - (prevEnd[2] || 0))**2)
         
-        if (dist > tolerance) {
+        if (!isDuplicate(start, prevEnd)) {
           points.push(start)
         }
       }
@@ -374,18 +376,14 @@ export function segmentsToPoints(segments, expectedType, options = {}) {
     const firstStart = getPoint(firstSegment.start)
     const lastEnd = getPoint(lastSegment.end)
     
-    const tolerance = 0.001
-    const dist = Math.sqrt((lastEnd[0] - firstStart[0])**2 + (lastEnd[1] - firstStart[1])**2)
-    
     // If the loop is closed (last end == first start), ensure the points array reflects this
-    if (dist < tolerance) {
+    if (isDuplicate(lastEnd, firstStart)) {
       // Check if the last point already equals the first point
       const lastPoint = points[points.length - 1]
       const firstPoint = points[0]
-      const lastPointDist = Math.sqrt((lastPoint[0] - firstPoint[0])**2 + (lastPoint[1] - firstPoint[1])**2)
       
       // If last point doesn't match first point, add it to close the loop
-      if (lastPointDist >= tolerance) {
+      if (!isDuplicate(lastPoint, firstPoint)) {
         points.push(firstPoint)
       }
     }